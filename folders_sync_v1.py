@@ -1,10 +1,44 @@
 import argparse
+import collections
+import errno
 import logging
+import logging.handlers
 import os
+import queue
 import time
-import hashlib
 import shutil
+import stat
 import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+
+# Chunk size used when reading files to compare their content.
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of bytes copied by the kernel in a single 'copy_file_range' call.
+COPY_CHUNK_SIZE = 1024 * 1024 * 1024
+
+# Default number of worker threads used to check and copy files in parallel.
+DEFAULT_WORKERS = (os.cpu_count() or 1) * 2
+
+# Maximum number of folders scanned at the same time, to avoid running out of file descriptors.
+MAX_OPEN_FOLDERS = 32
+_scan_slots = threading.Semaphore(MAX_OPEN_FOLDERS)
+
+# Metadata recorded in the folder snapshots for each file or subfolder, 'stat' being 'None' for subfolders.
+IndexEntry = collections.namedtuple("IndexEntry", ["is_folder", "is_symlink", "stat"])
+
+# Number of cycles after which the folders are synchronized even if no change was detected while watching them.
+FULL_SYNC_CYCLES = 10
+
+# Listener thread writing the queued log records to the log file and the console.
+_log_listener = None
 
 
 def setup_logging(log_file):
@@ -14,7 +48,9 @@ def setup_logging(log_file):
     This function ensures that the directory for the specified log file exists. 
     If the directory does not exist, it is created. It then configures the logging 
     system to log messages to the specified file and the console, using a predefined 
-    format that includes the timestamp, the log level, and the message content.
+    format that includes the timestamp, the log level, and the message content. Log 
+    records are put on a queue and written by a separate listener thread, so that 
+    the threads doing the synchronization are not blocked by the log outputs.
     This function also handles any potential exceptions that could be thrown.
 
     Args:
@@ -25,8 +61,10 @@ def setup_logging(log_file):
     ---------------------
         - Log messages are written to the specified log file.
         - Console output is also enabled for log messages.
-        - The log level is set to INFO.
+        - The log level is set to INFO, so only the outcome of each file and folder operation is logged, 
+          while the messages announcing each operation are logged at the DEBUG level.
         - Log message format: 'YYYY-MM-DD HH:MM:SS - LEVEL - Message'
+        - Log records are written by a listener thread, stopped with 'stop_logging'.
     
     Returns:
     -------
@@ -41,18 +79,22 @@ def setup_logging(log_file):
         if log_directory and not os.path.isdir(log_directory):
             os.makedirs(log_directory)
         
-        # Set-up basic configuration for logging.
-        logging.basicConfig(
-            filename=log_file,
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        
-        # Add console logging.
+        # Set-up the log file and console handlers, using the same format.
+        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", "%Y-%m-%d %H:%M:%S")
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
         console_handler = logging.StreamHandler()
-        console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', '%Y-%m-%d %H:%M:%S'))
-        logging.getLogger().addHandler(console_handler)
+        console_handler.setFormatter(formatter)
+
+        # Only queue the log records in the logging threads, and let a single listener thread format and write them.
+        global _log_listener
+        log_queue = queue.Queue(-1)
+        _log_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+        _log_listener.start()
+
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
         # Return 'True' when logging setup was done successfully.
         return True
@@ -64,36 +106,326 @@ def setup_logging(log_file):
         return False
 
 
-def generate_md5_checksum(file):
+def stop_logging():
     """
-    Generate the MD5 checksum for a given file.
+    Stops the logging listener thread, after writing any log records still in the queue.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
 
-    This function calculates the MD5 hash of a file by reading it in binary mode 
-    and processing it in chunks to avoid memory issues with any large files. The 
-    resulting hash is returned as a hexadecimal string.
-    This function also handles any potential exceptions that could be thrown.
+
+def files_equal(file_a, file_b):
+    """
+    Checks whether two files have the same content.
+
+    This function reads both files side by side in 1 MiB chunks, and stops as soon as 
+    a chunk differs, so differing files are usually not read until the end. Where supported, 
+    the kernel is asked to read both files ahead, so that disk reads overlap with the comparison.
+
+    Args:
+    ----
+    file_a (str): The path to the first file to compare.
+    file_b (str): The path to the second file to compare.
+
+    Returns:
+    -------
+    bool: 'True' if both files have the same content, 'False' otherwise.
+    """
+    with open(file_a, "rb") as fa, open(file_b, "rb") as fb:
+        if hasattr(os, "posix_fadvise"):
+            for f in (fa, fb):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+
+        while True:
+            chunk_a = fa.read(READ_CHUNK_SIZE)
+            chunk_b = fb.read(READ_CHUNK_SIZE)
+            if chunk_a != chunk_b:
+                return False
+            if not chunk_a:
+                return True
+
+
+def fast_copy(file_in_source, file_in_replica):
+    """
+    Copies a file together with its metadata, letting the kernel copy the data when possible.
+
+    This function behaves like 'shutil.copy2', but on systems providing 'os.copy_file_range' 
+    the file data is copied inside the kernel, without going through user space. On file 
+    systems supporting it, such as Btrfs or XFS, this can even share the data blocks instead 
+    of copying them. If the kernel copy is not supported for the given files, for example 
+    when they are on different file systems, the function falls back to 'shutil.copy2'.
 
     Args:
     ----
-    file (str): The path to the file for which to generate the MD5 checksum.
+    file_in_source (str): The path to the file to copy.
+    file_in_replica (str): The path where the file will be copied to.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(file_in_source, "rb") as fsrc, open(file_in_replica, "wb") as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_CHUNK_SIZE):
+                    pass
+            shutil.copystat(file_in_source, file_in_replica)
+            return
+
+        except OSError as e:
+            if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM):
+                raise
+
+    shutil.copy2(file_in_source, file_in_replica)
+
+
+def scan_folder(folder):
+    """
+    Scans a single folder, returning the metadata of its subfolders and files.
+
+    This function is built on 'os.scandir', so the file type of each entry is known without 
+    extra 'stat' calls, and the metadata of each file is read while the folder is being scanned. 
+    Where supported, the folder is opened once and scanned through its file descriptor, so that 
+    the metadata of each file is read relative to the folder, instead of resolving the full path 
+    of the file again. Symbolic links to folders are listed as subfolders. This function is run 
+    by several worker threads at the same time. Folders that cannot be scanned are logged and 
+    reported as failed, while files that cannot be read are logged and reported by name.
+
+    Args:
+    ----
+    folder (str): The path to the folder to scan.
 
     Returns:
     -------
-    str: The MD5 checksum of the file in hexadecimal format.
+    tuple: The name and 'IndexEntry' of each subfolder and file of the folder, and the names of the 
+        entries that could not be read, or 'None' if the folder could not be scanned.
     """
     try:
-        hash_md5 = hashlib.md5()
+        with _scan_slots:
+            if os.scandir in os.supports_fd:
+                folder_fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    with os.scandir(folder_fd) as scanner:
+                        return read_entries(folder, scanner)
+                finally:
+                    os.close(folder_fd)
+            else:
+                with os.scandir(folder) as scanner:
+                    return read_entries(folder, scanner)
+
+    except OSError as e:
+        logging.warning("Folder %s could not be scanned: %s", folder, e)
+        return None
+
+
+def read_entries(folder, scanner):
+    """
+    Reads the metadata of the directory entries returned by 'os.scandir' for a folder.
+
+    The metadata is read while the scanner is still open, since entries obtained by scanning 
+    a file descriptor can only read their metadata while that file descriptor is open.
+
+    Args:
+    ----
+    folder (str): The path to the scanned folder, used in log messages.
+    scanner (iterator): The iterator returned by 'os.scandir' for the folder.
+
+    Returns:
+    -------
+    tuple: The name and 'IndexEntry' of each subfolder and file of the folder, and the list of 
+        names of the entries that could not be read.
+    """
+    entries = []
+    failed_names = []
+    for entry in scanner:
+        try:
+            if entry.is_dir():
+                entries.append((entry.name, IndexEntry(True, entry.is_symlink(), None)))
+            else:
+                entries.append((entry.name, IndexEntry(False, entry.is_symlink(), read_stat(entry))))
+        except OSError as e:
+            logging.warning("File %s could not be read: %s", os.path.join(folder, entry.name), e)
+            failed_names.append(entry.name)
+    return entries, failed_names
+
+
+def read_stat(entry):
+    """
+    Reads the metadata of a file entry, following symbolic links.
+
+    If the entry is a symbolic link whose target does not exist, the metadata of the link itself 
+    is returned instead, so that the link is still indexed and can be told apart by its mode.
+
+    Args:
+    ----
+    entry (os.DirEntry): The directory entry of the file.
+
+    Returns:
+    -------
+    os.stat_result: The metadata of the file, or of the broken symbolic link.
+    """
+    try:
+        return entry.stat()
+    except OSError:
+        if not entry.is_symlink():
+            raise
+        return entry.stat(follow_symlinks=False)
+
+
+def index_folder(root, executor):
+    """
+    Builds an index of every file and subfolder found under a folder.
+
+    This function scans the whole folder tree once and records the metadata of each file 
+    and subfolder, keyed by its path relative to the 'root' folder. Each subfolder is scanned 
+    as a separate task on the given executor as soon as it is found, so that several folders 
+    are scanned in parallel. Symbolic links to folders are indexed but not followed. The index 
+    can then be used to check whether a path exists, and to get its metadata, without issuing 
+    a separate 'stat' call for each lookup. The relative paths of the folders that could not be 
+    scanned, and of the entries that could not be read, are returned as well, since they are 
+    missing from the index.
+
+    Args:
+    ----
+    root (str): The path to the folder to index.
+    executor (concurrent.futures.Executor): The executor used to scan the subfolders.
+
+    Returns:
+    -------
+    tuple: The 'IndexEntry' of all files and subfolders, keyed by their relative path, and the set of 
+        relative paths of the folders and entries that could not be read, '' being the 'root' folder itself.
+    """
+    index = {}
+    failed_paths = set()
+    root_prefix = os.path.join(root, "")
+    pending_scans = {executor.submit(scan_folder, root): ""}
+    while pending_scans:
+        done_scans, _ = wait(pending_scans, return_when=FIRST_COMPLETED)
+        for scan in done_scans:
+            relative_path = pending_scans.pop(scan)
+            scan_result = scan.result()
+            if scan_result is None:
+                failed_paths.add(relative_path)
+                continue
+            entries, failed_names = scan_result
+
+            # Build the relative paths by concatenating a precomputed prefix, which is cheaper than 'os.path.join'.
+            relative_prefix = relative_path + os.sep if relative_path else ""
+            failed_paths.update(relative_prefix + name for name in failed_names)
+
+            for name, entry in entries:
+                relative_entry = relative_prefix + name
+                index[relative_entry] = entry
+                if entry.is_folder and not entry.is_symlink:
+                    pending_scans[executor.submit(scan_folder, root_prefix + relative_entry)] = relative_entry
+    return index, failed_paths
+
+
+def is_within_folders(relative_path, folders):
+    """
+    Checks whether a relative path is one of the given relative folders, or is inside one of them.
+
+    Args:
+    ----
+    relative_path (str): The relative path to check.
+    folders (set): The relative paths of the folders.
+
+    Returns:
+    -------
+    bool: 'True' if the path is one of the folders or is inside one of them, 'False' otherwise.
+    """
+    while relative_path:
+        if relative_path in folders:
+            return True
+        relative_path = os.path.dirname(relative_path)
+    return False
+
+
+def check_and_copy(file_in_source, source_stat, file_in_replica, replica_stat=None):
+    """
+    Copies a file from the source folder to the replica folder if it is missing or outdated.
+
+    This function checks whether the file exists in the replica folder snapshot, and if it does, compares 
+    the size and modification time of both files, only comparing their content when the sizes 
+    match but the modification times differ. The file is copied when any difference is found. When 
+    only the modification times differ, the metadata of the file is copied instead, so that the 
+    content does not need to be compared again in the next synchronization cycles. Files that are 
+    not regular files, such as named pipes or broken symbolic links, are logged and skipped.
+    This function is run by several worker threads at the same time, and also handles any 
+    potential exceptions that could be thrown.
+
+    Args:
+    ----
+    file_in_source (str): The path to the file in the source folder.
+    source_stat (os.stat_result): The metadata of the file in the source folder.
+    file_in_replica (str): The path to the corresponding file in the replica folder.
+    replica_stat (os.stat_result, optional): The metadata of the file in the replica folder, 
+        or 'None' if the file does not exist in the replica folder.
+    """
+    try:
+        # Check if files dont't exist in replica folder OR check if it was modified by comparing the size and modification time 
+        # of each one, and only comparing the content of each one when the sizes match but the modification times differ.
+        reason = None
+        # Only regular files are copied, since opening a named pipe, a socket or a device could block or fail.
+        if not stat.S_ISREG(source_stat.st_mode):
+            file_kind = "a broken symbolic link" if stat.S_ISLNK(source_stat.st_mode) else "not a regular file"
+            logging.warning("File %s is %s, skipping it.", file_in_source, file_kind)
+            return
+
+        if replica_stat is None:
+            reason = "found in source folder and not in replica folder"
+        else:
+            if source_stat.st_size != replica_stat.st_size:
+                reason = "found in source folder and in replica folder but with different size"
+            elif source_stat.st_mtime_ns != replica_stat.st_mtime_ns:
+                try:
+                    if not files_equal(file_in_source, file_in_replica):
+                        reason = "found in source folder and in replica folder but with different content"
+                    else:
+                        shutil.copystat(file_in_source, file_in_replica)
+                        logging.info("File %s has the same content in replica folder, its metadata has been updated.", file_in_source)
+                except FileNotFoundError:
+                    # The file was deleted from the replica folder after the snapshot was taken.
+                    reason = "found in source folder and no longer in replica folder"
+
+        if reason:
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("File %s %s, copying the file to replica folder.", file_in_source, reason)
+            fast_copy(file_in_source, file_in_replica)
+            logging.info("File %s has been copied to replica folder.", file_in_source)
 
-        with open(file, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
-    
     except Exception as e:
-        logging.error(f"An error occurred during the generation of MD5 checksum for the file {file}: {e}")
+        logging.error("An error occurred while synchronizing the file %s: %s", file_in_source, e)
 
 
-def synchronize_folders(source_folder, replica_folder):
+def delete_path(target_path, is_folder):
+    """
+    Deletes a file or a folder, with all its contents, from the replica folder.
+
+    This function is run by several worker threads at the same time, and also handles any 
+    potential exceptions that could be thrown.
+
+    Args:
+    ----
+    target_path (str): The path to the file or folder in the replica folder.
+    is_folder (bool): Whether the path is a folder, rather than a file or a symbolic link.
+    """
+    try:
+        if is_folder:
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("Folder %s found in replica folder and not in source folder, deleting the folder in replica folder.", target_path)
+            shutil.rmtree(target_path)
+            logging.info("Folder %s has been deleted from the replica folder.", target_path)
+        else:
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("File %s found in replica folder and not in source folder, deleting the file from replica folder.", target_path)
+            os.remove(target_path)
+            logging.info("File %s has been deleted from the replica folder.", target_path)
+
+    except Exception as e:
+        logging.error("An error occurred while deleting %s: %s", target_path, e)
+
+
+def synchronize_folders(source_folder, replica_folder, workers=DEFAULT_WORKERS):
     """
     Synchronizes the contents of a source folder with a replica folder.
 
@@ -101,11 +433,13 @@ def synchronize_folders(source_folder, replica_folder):
     It mainly performs the following tasks:
     
     1. Checks if the 'source_folder' exists. If it does not, the program logs a warning and terminates the synchronization cycle.
-    2. Ensures the 'replica_folder' exists. If it doesn't, the folder is created.
-    3. Walks through the 'source_folder' and performs the following actions:
-       - Copies any files or subfolders that exist in the source folder but are missing or outdated (based on MD5 checksum) in the replica folder.
+    2. Ensures the 'replica_folder' exists. If it doesn't, the folder is created. A snapshot of the contents 
+       of both folders is then taken, scanning their subfolders in parallel.
+    3. Goes through the snapshot of the 'source_folder' and performs the following actions:
        - Creates any missing subfolders in the 'replica_folder' to match the structure of the 'source_folder'.
-    4. Walks through the 'replica_folder' and deletes any files or subfolders that no longer exist in the 'source_folder'.
+       - Copies any files that exist in the source folder but are missing or outdated (based on size, modification time and content) in the replica folder, checking the files in parallel.
+    4. Goes through the snapshot of the 'replica_folder' and deletes any files or subfolders that no longer exist in the 'source_folder', in parallel. 
+       Paths inside source subfolders that could not be scanned are kept.
     
     Args:
     ----
@@ -113,80 +447,223 @@ def synchronize_folders(source_folder, replica_folder):
         The path to the source folder that needs to be synchronized.
     replica_folder : str
         The path to the replica folder where the contents will be mirrored.
+    workers : int, optional
+        The number of worker threads used to scan folders, to check and copy files, and to delete files in parallel.
     """
     try:
         # 1. Check whether the Source folder exists.
         logging.info("Starting checking the source folder...")
         if not os.path.isdir(source_folder):
-            logging.warning(f"Source folder {source_folder} does not exist, ending the synchronization process.")
+            logging.warning("Source folder %s does not exist, ending the synchronization process.", source_folder)
         else:
-            logging.info(f"Source folder {source_folder} exists.")
+            logging.info("Source folder %s exists.", source_folder)
             
             # 2. Ensure that the Replica folder exists.
             logging.info("Starting checking the replica folder...")
             if not os.path.isdir(replica_folder):
-                logging.info(f"Replica folder not found, creating the replica folder {replica_folder}")
+                logging.info("Replica folder not found, creating the replica folder %s", replica_folder)
 
                 # Create a new replica folder.
                 os.makedirs(replica_folder)
-                logging.info(f"Replica folder {replica_folder} created.")
+                logging.info("Replica folder %s created.", replica_folder)
             else:
-                logging.info(f"Replica folder {replica_folder} exists.")
-
-            # 3. Walk through Source folder to check any added files or sub-folders.
-            for current_folder, subfolders, files in os.walk(source_folder):
-                
-                # 3.1. Calculate the corresponding folder path in Replica folder:
-                relative_path = os.path.relpath(current_folder, source_folder)
-                
-                # 3.2. Map the relative path to Replica folder.
-                target_folder = os.path.join(replica_folder, relative_path)
-
-                # 3.3. Ensure the corresponding folder exists in Replica folder:
-                if not os.path.exists(target_folder):
-                    logging.info(f"Folder {relative_path} found in source folder and not in replica folder, creating the folder in replica folder.")
-                    os.makedirs(target_folder)
-                    logging.info(f"Folder {relative_path} has been created in replica folder.")
-                
-                # 3.4. Copy files from source folder to replica folder if they don't exist or are modified.
-                for file in files:
-                    file_in_source = os.path.join(current_folder, file)
-                    file_in_replica = os.path.join(target_folder, file)
-
-                    # Check if files dont't exist in replica folder OR check if it was modified by comparing the MD5 hash generated for each one.
-                    if not os.path.exists(file_in_replica) or generate_md5_checksum(file_in_source) != generate_md5_checksum(file_in_replica):
-                        reason = "found in source folder and not in replica folder" if not os.path.exists(file_in_replica) else "found in source folder and in replica folder but with different MD5 Hash"
-                        logging.info(f"File {file_in_source} {reason}, copying the file to replica folder.")
-                        shutil.copy2(file_in_source, file_in_replica)
-                        logging.info(f"File {file_in_source} has been copied to replica folder.")
-
-            # 4. Walk through Replica folder and delete any files or directories not in Source folder.
-            for current_folder, subfolders, files in os.walk(replica_folder):
-                
-                # 4.1. Calculate the corresponding folder path in Replica folder.
-                relative_path = os.path.relpath(current_folder, replica_folder)
-                
-                # 4.2. Map the relative path to Source folder.
-                original_folder = os.path.join(source_folder, relative_path)
-
-                # 4.3. Delete folders that don't exist in Source folder.
-                for subfolder in subfolders:
-                    target_subfolder = os.path.join(current_folder, subfolder)
-                    if not os.path.exists(os.path.join(original_folder, subfolder)):
-                        logging.info(f"Folder {target_subfolder} found in replica folder and not in source folder, deleting the folder in replica folder.")
-                        shutil.rmtree(target_subfolder)
-                        logging.info(f"Folder {target_subfolder} has been deleted from the replica folder.")
-
-                # 4.4. Delete files that don't exist in Source folder.
-                for file in files:
-                    target_file = os.path.join(current_folder, file)
-                    if not os.path.exists(os.path.join(original_folder, file)):
-                        logging.info(f"File {target_file} found in replica folder and not in source folder, deleting the file from replica folder.")
-                        os.remove(target_file)
-                        logging.info(f"File {target_file} has been deleted from the replica folder.")
+                logging.info("Replica folder %s exists.", replica_folder)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+
+                # 2.1. Take a snapshot of both Source and Replica folders, scanning their sub-folders in parallel.
+                source_index, source_failed_paths = index_folder(source_folder, executor)
+                replica_index, _ = index_folder(replica_folder, executor)
+
+                source_prefix = os.path.join(source_folder, "")
+                replica_prefix = os.path.join(replica_folder, "")
+
+                # 2.2. Delete the Replica paths that are a file in one folder and a sub-folder in the other, so that they are created again below.
+                replaced_paths = [relative_path for relative_path in sorted(replica_index.keys() & source_index.keys())
+                                  if replica_index[relative_path].is_folder != source_index[relative_path].is_folder]
+                if replaced_paths:
+                    for relative_path in replaced_paths:
+                        logging.info("Path %s has changed type in source folder, replacing it in replica folder.", replica_prefix + relative_path)
+                    list(executor.map(delete_path,
+                                      (replica_prefix + relative_path for relative_path in replaced_paths),
+                                      (replica_index[relative_path].is_folder and not replica_index[relative_path].is_symlink for relative_path in replaced_paths)))
+                    replica_index = {relative_path: entry for relative_path, entry in replica_index.items()
+                                     if not is_within_folders(relative_path, set(replaced_paths))}
+
+                # 3. Go through the Source folder snapshot to check any added files or sub-folders.
+                # 3.1. Ensure the sub-folders exist in Replica folder, creating parent folders first so that a single 'mkdir' call is needed for each one.
+                source_folders = sorted(relative_path for relative_path, entry in source_index.items() if entry.is_folder and not entry.is_symlink)
+                for relative_path in source_folders:
+                    if relative_path not in replica_index:
+                        if logging.getLogger().isEnabledFor(logging.DEBUG):
+                            logging.debug("Folder %s found in source folder and not in replica folder, creating the folder in replica folder.", relative_path)
+                        try:
+                            os.mkdir(replica_prefix + relative_path)
+                            logging.info("Folder %s has been created in replica folder.", relative_path)
+                        except FileExistsError:
+                            # The folder was created after the snapshot was taken.
+                            pass
+
+                # 3.2. Copy files from source folder to replica folder if they don't exist or are modified, checking the files in parallel.
+                source_files = [(relative_path, entry.stat) for relative_path, entry in source_index.items() if not entry.is_folder]
+                list(executor.map(check_and_copy,
+                                  (source_prefix + relative_path for relative_path, source_stat in source_files),
+                                  (source_stat for relative_path, source_stat in source_files),
+                                  (replica_prefix + relative_path for relative_path, source_stat in source_files),
+                                  (replica_index[relative_path].stat if relative_path in replica_index else None for relative_path, source_stat in source_files)))
+
+                # 4. Delete any files or directories in the Replica folder snapshot that are not in Source folder. 
+                # Nothing is deleted if the Source folder itself could not be scanned, since its contents are unknown.
+                if "" in source_failed_paths:
+                    logging.warning("Source folder %s could not be scanned, skipping the deletion of files and folders from the replica folder.", source_folder)
+                else:
+                    stale_paths = replica_index.keys() - source_index.keys()
+
+                    # 4.1. Keep paths that could not be read in Source folder, or that are inside Source sub-folders that could not be scanned, since they may still exist there.
+                    if source_failed_paths:
+                        stale_paths = {relative_path for relative_path in stale_paths if not is_within_folders(relative_path, source_failed_paths)}
+
+                    # 4.2. Skip paths whose parent folder is deleted as a whole, so that the remaining paths can be deleted in parallel.
+                    deleted_paths = [relative_path for relative_path in sorted(stale_paths) if os.path.dirname(relative_path) not in stale_paths]
+
+                    # 4.3. Delete the folders and files that don't exist in Source folder.
+                    list(executor.map(delete_path,
+                                      (replica_prefix + relative_path for relative_path in deleted_paths),
+                                      (replica_index[relative_path].is_folder and not replica_index[relative_path].is_symlink for relative_path in deleted_paths)))
     
     except Exception as e:
-        logging.error(f"An error occurred during the synchronization process: {e}")
+        logging.error("An error occurred during the synchronization process: %s", e)
+
+
+def positive_int(value):
+    """
+    Parses a command-line argument as an integer greater than zero.
+
+    Args:
+    ----
+    value (str): The value of the command-line argument.
+
+    Returns:
+    -------
+    int: The parsed integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def non_negative_int(value):
+    """
+    Parses a command-line argument as an integer greater than or equal to zero.
+
+    Args:
+    ----
+    value (str): The value of the command-line argument.
+
+    Returns:
+    -------
+    int: The parsed integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be at least 0, got {number}")
+    return number
+
+
+class ChangeHandler:
+    """
+    Watchdog event handler, flagging any change made in the watched folders.
+
+    Events only reporting that a file was opened or closed without being written are ignored, 
+    since the synchronization itself opens files to compare them. The deletion or move of one 
+    of the watched folders themselves is also flagged separately, since the watch then needs to 
+    be started again.
+
+    Args:
+    ----
+    changes (threading.Event): The event set whenever a change is detected.
+    roots_replaced (threading.Event): The event set whenever a watched folder is deleted or moved.
+    roots (iterable): The paths to the watched folders.
+    """
+
+    def __init__(self, changes, roots_replaced, roots):
+        self.changes = changes
+        self.roots_replaced = roots_replaced
+        self.roots = {os.path.abspath(root) for root in roots}
+
+    def dispatch(self, event):
+        if event.event_type in ("opened", "closed_no_write"):
+            return
+
+        self.changes.set()
+        if event.event_type in ("deleted", "moved") and os.path.abspath(os.fsdecode(event.src_path)) in self.roots:
+            self.roots_replaced.set()
+
+
+def folder_identity(folder):
+    """
+    Returns the device and inode numbers of a folder, which change when the folder is replaced.
+
+    Args:
+    ----
+    folder (str): The path to the folder.
+
+    Returns:
+    -------
+    tuple: The device and inode numbers of the folder, or 'None' if it does not exist.
+    """
+    try:
+        folder_stat = os.stat(folder)
+        return folder_stat.st_dev, folder_stat.st_ino
+    except OSError:
+        return None
+
+
+def watch_folders(folders, changes, roots_replaced):
+    """
+    Starts watching folders for changes, using the optional 'watchdog' package.
+
+    This function schedules a recursive watch of each folder and starts the watchdog observer 
+    thread, which sets the 'changes' event whenever a file or subfolder is created, modified, 
+    moved or deleted. If 'watchdog' is not installed, or the folders cannot be watched, no 
+    observer is started and the folders should be synchronized at every cycle.
+    This function also handles any potential exceptions that could be thrown.
+
+    Args:
+    ----
+    folders (iterable): The paths to the folders to watch.
+    changes (threading.Event): The event set whenever a change is detected.
+    roots_replaced (threading.Event): The event set whenever one of the watched folders is deleted or moved.
+
+    Returns:
+    -------
+    Observer: The started watchdog observer, or 'None' if the folders are not watched.
+    """
+    if Observer is None:
+        logging.info("Package 'watchdog' is not installed, synchronizing the folders at every cycle.")
+        return None
+
+    try:
+        observer = Observer()
+        handler = ChangeHandler(changes, roots_replaced, folders)
+        for folder in folders:
+            observer.schedule(handler, folder, recursive=True)
+        observer.start()
+        logging.info("Watching the source and replica folders for changes.")
+        return observer
+
+    except Exception as e:
+        logging.warning("Folders could not be watched for changes, synchronizing the folders at every cycle: %s", e)
+        return None
 
 
 def main():
@@ -196,19 +673,24 @@ def main():
     This function parses command-line arguments to obtain the source folder, replica folder,
     synchronization interval, and log file path. It sets up logging to the specified log file and 
     enters an infinite loop that repeatedly synchronizes the contents of the source folder 
-    to the replica folder. The process is logged at each step, and the function waits for the
-    specified interval (in seconds) between synchronizations.
+    to the replica folder. The process is logged at each step, and a new synchronization is 
+    started every specified interval (in seconds), measured with a monotonic clock. When the 
+    optional 'watchdog' package is installed, both folders are watched for changes, and the 
+    cycles in which no change was detected skip the synchronization, except every few cycles. 
+    The watch is started again whenever one of the folders is deleted, moved or replaced.
 
     Command-line arguments:
         source_folder (str): Path to the source folder containing the files to be synchronized.
         replica_folder (str): Path to the replica folder where the files will be copied.
         interval (int): Time interval (in seconds) between each synchronization cycle.
         log_file (str): Path to the log file where synchronization activities are recorded.
+        --workers (int, optional): Number of worker threads used to check and copy files in parallel.
 
     Logging:
         Logs the start of the program, each synchronization process cycle, and when the system 
         sleeps between synchronization cycles.
     """
+    observer = None
     try:
         # Create an argument parser object to handle command-line arguments.
         parser = argparse.ArgumentParser(description="""Folders Synchronization Tool""")
@@ -216,8 +698,9 @@ def main():
         # Add arguments for the source folder, replica folder, synchronization interval, and log file path.
         parser.add_argument("source_folder", type=str, help="Path to the source folder containing the files to be synchronized.")
         parser.add_argument("replica_folder", type=str, help="Path to the replica folder where the files will be copied.")
-        parser.add_argument("interval_time", type=int, help="Time interval (in seconds) between each synchronization cycle.")
+        parser.add_argument("interval_time", type=non_negative_int, help="Time interval (in seconds) between each synchronization cycle.")
         parser.add_argument("log_file", type=str, help="Path to the log file where synchronization activities are recorded.")
+        parser.add_argument("--workers", type=positive_int, default=DEFAULT_WORKERS, help=f"Number of worker threads used to check and copy files in parallel (default: {DEFAULT_WORKERS}).")
 
         # Parse the command-line arguments and store them in the 'args' variable.
         args = parser.parse_args()
@@ -231,15 +714,65 @@ def main():
         logging.info("************************************************************")
         logging.info("Syncronization Application Initiated.")
 
+        # Bind the arguments and the sleep message once, instead of building them in every synchronization cycle.
+        source_folder, replica_folder, interval_time, workers = args.source_folder, args.replica_folder, args.interval_time, args.workers
+        sleep_message = f"Syncronization process ended, and sleeping until the next cycle, {interval_time} seconds after this one started."
+        overrun_message = f"Syncronization process took longer than {interval_time} seconds, starting the next cycle immediately."
+        skip_message = "No changes detected in the source and replica folders, skipping the syncronization process."
+
+        # Flags set whenever a change is detected in the folders, and whenever a watched folder is deleted or moved.
+        changes = threading.Event()
+        roots_replaced = threading.Event()
+
+        # Device and inode numbers of the folders when the watch was started, and number of cycles skipped since the last synchronization.
+        watched_roots = None
+        skipped_cycles = 0
+
         # Enter an infinite loop to repeatedly synchronize the folders at the specified interval.
+        next_cycle_time = time.monotonic()
         while True:
             logging.info("------------------------------------------------------------")
-            logging.info("Starting the syncronization process...")
-            synchronize_folders(args.source_folder, args.replica_folder)
-            logging.info(f"Syncronization process ended, and sleeping for {args.interval_time} seconds.")
-            
-            # Pause execution for the specified interval (in seconds) before starting the next synchronization cycle.
-            time.sleep(args.interval_time)
+
+            # The watch needs to be started again when a watched folder was deleted, moved or replaced, since it only 
+            # follows the original folders, or when the observer thread stopped.
+            rewatch = (roots_replaced.is_set()
+                       or (folder_identity(source_folder), folder_identity(replica_folder)) != watched_roots
+                       or (observer is not None and not observer.is_alive()))
+
+            # Skip the synchronization when the folders are watched and no change was detected since the last one, 
+            # still synchronizing every few cycles in case a change was missed.
+            if observer is None or rewatch or changes.is_set() or skipped_cycles >= FULL_SYNC_CYCLES:
+                changes.clear()
+                skipped_cycles = 0
+                logging.info("Starting the syncronization process...")
+                synchronize_folders(source_folder, replica_folder, workers)
+
+                # Start watching the folders again once the replica folder exists, and synchronize again in the next cycle 
+                # to cover any change made before the watch started.
+                if rewatch:
+                    if observer is not None:
+                        observer.stop()
+                    roots_replaced.clear()
+                    watched_roots = (folder_identity(source_folder), folder_identity(replica_folder))
+                    observer = watch_folders((source_folder, replica_folder), changes, roots_replaced)
+                    changes.set()
+            else:
+                skipped_cycles += 1
+                logging.info(skip_message)
+
+            # Pause execution until the start time of the next synchronization cycle, so that the cycles start every interval 
+            # (in seconds) regardless of how long each synchronization takes.
+            next_cycle_time += interval_time
+            remaining_time = next_cycle_time - time.monotonic()
+            if remaining_time > 0:
+                logging.info(sleep_message)
+                time.sleep(remaining_time)
+            else:
+                # Do not try to catch up with the missed cycles, and start counting the interval again from now. 
+                # With no interval, the cycles are meant to run back to back, so this is not reported as an overrun.
+                if interval_time > 0:
+                    logging.warning(overrun_message)
+                next_cycle_time = time.monotonic()
     
     except Exception as e:
         print(f"An error occurred during the program initialization: {e}")
@@ -247,7 +780,14 @@ def main():
         print("\nExiting program due to initialization failure.\n")
         sys.exit(1)
 
+    finally:
+        # Stop watching the folders, and flush the remaining log records before exiting.
+        if observer is not None:
+            observer.stop()
+        stop_logging()
+
 
 ###############################################
 # Initiate the Synchronization program.
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
\ No newline at end of file